@@ -7,15 +7,20 @@ from simulation import CostParameters, InitialState, DiscreteDistributions
 # -----------------------------
 # Discrete distributions
 # -----------------------------
-# Daily demand distribution (from the assignment)
-DEMAND_VALUES = np.array([0, 1, 2, 3, 4], dtype=int)
-DEMAND_PROBS = np.array([0.10, 0.25, 0.35, 0.21, 0.09], dtype=float)
+# Daily demand distribution (from the assignment). Explicit int64/float64
+# dtypes pin the Numba kernel to a single signature on every platform, and
+# the read-only flag guards the module constants against accidental mutation.
+DEMAND_VALUES = np.ascontiguousarray([0, 1, 2, 3, 4], dtype=np.int64)
+DEMAND_PROBS = np.ascontiguousarray([0.10, 0.25, 0.35, 0.21, 0.09], dtype=np.float64)
 
 # Lead-time distribution (in days)
-LEAD_VALUES = np.array([1, 2, 3], dtype=int)
-LEAD_PROBS = np.array([0.60, 0.30, 0.10], dtype=float)
+LEAD_VALUES = np.ascontiguousarray([1, 2, 3], dtype=np.int64)
+LEAD_PROBS = np.ascontiguousarray([0.60, 0.30, 0.10], dtype=np.float64)
 
-DEFAULT_DISTRIBUTIONS = DiscreteDistributions(
+for _arr in (DEMAND_VALUES, DEMAND_PROBS, LEAD_VALUES, LEAD_PROBS):
+    _arr.setflags(write=False)
+
+DEFAULT_DISTRIBUTIONS = DiscreteDistributions.from_probs(
     demand_values=DEMAND_VALUES,
     demand_probs=DEMAND_PROBS,
     lead_values=LEAD_VALUES,
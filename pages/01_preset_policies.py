@@ -1,14 +1,7 @@
 import streamlit as st
-import pandas as pd
-
-from config import (
-    PRESET_POLICIES,
-    DEFAULT_COSTS,
-    DEFAULT_INITIAL_STATE,
-    DEFAULT_DISTRIBUTIONS,
-    DEFAULT_NUM_CYCLES,
-)
-from simulation import simulate_policy, CostParameters
+
+from shared import preset_daily_df, run_all_presets
+from sidebar import cost_sidebar
 
 
 st.title("Preset Policies (A–D)")
@@ -23,74 +16,22 @@ the performance of each policy changes.
 """
 )
 
-# ---- Sidebar controls ----
-st.sidebar.header("Preset Policy Simulation – Global Parameters")
-
-num_cycles = st.sidebar.slider(
-    "Number of cycles", min_value=5, max_value=30, value=DEFAULT_NUM_CYCLES, step=1
-)
+# ---- Sidebar controls (shared across pages via session state) ----
+cost_params, num_cycles, seed = cost_sidebar("Preset Policy Simulation – Global Parameters")
 
-holding_cost = st.sidebar.number_input(
-    "Holding cost per unit per period", value=DEFAULT_COSTS.holding_cost, step=1.0
-)
-shortage_cost = st.sidebar.number_input(
-    "Shortage cost per unit per period", value=DEFAULT_COSTS.shortage_cost, step=1.0
-)
-unit_cost = st.sidebar.number_input(
-    "Purchasing cost per unit", value=DEFAULT_COSTS.unit_cost, step=1.0
+# ---- Run simulations for all preset policies (shared/cached across pages) ----
+costs_tuple = (
+    cost_params.holding_cost,
+    cost_params.shortage_cost,
+    cost_params.unit_cost,
+    cost_params.ordering_cost,
 )
-ordering_cost = st.sidebar.number_input(
-    "Fixed ordering cost", value=DEFAULT_COSTS.ordering_cost, step=1.0
+summary_df = run_all_presets(
+    num_cycles=num_cycles,
+    costs_tuple=costs_tuple,
+    seed=seed,
 )
 
-seed_input = st.sidebar.text_input("Random seed (optional)", value="0")
-try:
-    seed = int(seed_input)
-except ValueError:
-    seed = None
-
-cost_params = CostParameters(
-    holding_cost=holding_cost,
-    shortage_cost=shortage_cost,
-    unit_cost=unit_cost,
-    ordering_cost=ordering_cost,
-)
-
-# ---- Run simulations for all preset policies ----
-summary_rows = []
-results: dict[str, dict] = {}
-
-for name, (M, N) in PRESET_POLICIES.items():
-    df, total_cost, avg_cost = simulate_policy(
-        M=M,
-        N=N,
-        num_cycles=num_cycles,
-        costs=cost_params,
-        initial_state=DEFAULT_INITIAL_STATE,
-        distributions=DEFAULT_DISTRIBUTIONS,
-        seed=seed,
-    )
-
-    results[name] = {
-        "M": M,
-        "N": N,
-        "df": df,
-        "total_cost": total_cost,
-        "avg_cost": avg_cost,
-    }
-
-    summary_rows.append(
-        {
-            "Policy": name,
-            "M": M,
-            "N": N,
-            "Total Cost": round(total_cost, 2),
-            "Avg. Cost per Cycle": round(avg_cost, 2),
-        }
-    )
-
-summary_df = pd.DataFrame(summary_rows)
-
 st.subheader("Summary Table – Preset Policies")
 st.dataframe(summary_df, use_container_width=True)
 
@@ -107,7 +48,32 @@ st.success(
 st.markdown("---")
 st.subheader("Inspect Daily Simulation Results")
 
-selected_policy = st.selectbox("Choose a policy to inspect:", list(PRESET_POLICIES.keys()))
 
-st.markdown(f"### {selected_policy}")
-st.dataframe(results[selected_policy]["df"], use_container_width=True)
+@st.fragment
+def _inspect_daily_results() -> None:
+    """Render the policy inspector; reruns in isolation when the selection changes.
+
+    The daily DataFrame is only built (and cached) for the selected policy.
+    """
+    selected_policy = st.selectbox(
+        "Choose a policy to inspect:", list(summary_df["Policy"])
+    )
+
+    df = preset_daily_df(selected_policy, num_cycles, costs_tuple, seed)
+
+    st.markdown(f"### {selected_policy}")
+    # Render only the requested prefix; the full table is available as CSV.
+    # min_value=1 keeps the bounds valid for short horizons (e.g. N=1).
+    rows_to_show = st.number_input(
+        "Rows to show", min_value=1, max_value=len(df), value=min(50, len(df)), step=10
+    )
+    st.dataframe(df.head(rows_to_show), use_container_width=True)
+    st.download_button(
+        "Download full daily results (CSV)",
+        df.to_csv(index=False).encode(),
+        file_name="preset_policy_daily_results.csv",
+        mime="text/csv",
+    )
+
+
+_inspect_daily_results()
@@ -1,12 +1,8 @@
 import streamlit as st
 
-from config import (
-    DEFAULT_COSTS,
-    DEFAULT_INITIAL_STATE,
-    DEFAULT_DISTRIBUTIONS,
-    DEFAULT_NUM_CYCLES,
-)
-from simulation import simulate_policy, CostParameters
+from config import DEFAULT_INITIAL_STATE, DEFAULT_DISTRIBUTIONS
+from sidebar import cost_sidebar
+from simulation import simulate_policy
 
 
 st.title("Custom (M, N) Policy")
@@ -36,38 +32,10 @@ custom_N = st.sidebar.number_input(
     step=1,
 )
 
-num_cycles = st.sidebar.slider(
-    "Number of cycles", min_value=5, max_value=30, value=DEFAULT_NUM_CYCLES, step=1
-)
-
 st.sidebar.markdown("---")
-st.sidebar.header("Cost Parameters")
 
-holding_cost = st.sidebar.number_input(
-    "Holding cost per unit per period", value=DEFAULT_COSTS.holding_cost, step=1.0
-)
-shortage_cost = st.sidebar.number_input(
-    "Shortage cost per unit per period", value=DEFAULT_COSTS.shortage_cost, step=1.0
-)
-unit_cost = st.sidebar.number_input(
-    "Purchasing cost per unit", value=DEFAULT_COSTS.unit_cost, step=1.0
-)
-ordering_cost = st.sidebar.number_input(
-    "Fixed ordering cost", value=DEFAULT_COSTS.ordering_cost, step=1.0
-)
-
-seed_input = st.sidebar.text_input("Random seed (optional)", value="0")
-try:
-    seed = int(seed_input)
-except ValueError:
-    seed = None
-
-cost_params = CostParameters(
-    holding_cost=holding_cost,
-    shortage_cost=shortage_cost,
-    unit_cost=unit_cost,
-    ordering_cost=ordering_cost,
-)
+# Shared controls (persisted in session state across pages)
+cost_params, num_cycles, seed = cost_sidebar("Cost Parameters")
 
 st.info(
     f"Simulating custom policy with **M = {custom_M}**, **N = {custom_N}**, "
@@ -90,4 +58,23 @@ st.write(f"**Total cost over the horizon**: ${total_cost:,.2f}")
 st.write(f"**Average cost per cycle**: ${avg_cost:,.2f}")
 
 st.subheader("Daily Simulation Output")
-st.dataframe(df, use_container_width=True)
+
+
+@st.fragment
+def _daily_output() -> None:
+    """Render the daily table; reruns in isolation when the row count changes."""
+    # Render only the requested prefix; the full table is available as CSV.
+    # min_value=1 keeps the bounds valid for short horizons (e.g. N=1).
+    rows_to_show = st.number_input(
+        "Rows to show", min_value=1, max_value=len(df), value=min(50, len(df)), step=10
+    )
+    st.dataframe(df.head(rows_to_show), use_container_width=True)
+    st.download_button(
+        "Download full daily results (CSV)",
+        df.to_csv(index=False).encode(),
+        file_name="custom_policy_daily_results.csv",
+        mime="text/csv",
+    )
+
+
+_daily_output()
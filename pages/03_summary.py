@@ -1,14 +1,7 @@
 import streamlit as st
-import pandas as pd
 
-from config import (
-    PRESET_POLICIES,
-    DEFAULT_COSTS,
-    DEFAULT_INITIAL_STATE,
-    DEFAULT_DISTRIBUTIONS,
-    DEFAULT_NUM_CYCLES,
-)
-from simulation import simulate_policy, CostParameters
+from shared import run_all_presets
+from sidebar import cost_sidebar
 
 
 st.title("Summary & Charts – Preset Policies")
@@ -20,64 +13,20 @@ preset policies from the assignment.
 """
 )
 
-# ---- Sidebar controls ----
-st.sidebar.header("Summary – Global Parameters")
-
-num_cycles = st.sidebar.slider(
-    "Number of cycles", min_value=5, max_value=30, value=DEFAULT_NUM_CYCLES, step=1
-)
+# ---- Sidebar controls (shared across pages via session state) ----
+cost_params, num_cycles, seed = cost_sidebar("Summary – Global Parameters")
 
-holding_cost = st.sidebar.number_input(
-    "Holding cost per unit per period", value=DEFAULT_COSTS.holding_cost, step=1.0
-)
-shortage_cost = st.sidebar.number_input(
-    "Shortage cost per unit per period", value=DEFAULT_COSTS.shortage_cost, step=1.0
+# ---- Run simulations (shared/cached across pages) ----
+summary_df = run_all_presets(
+    num_cycles=num_cycles,
+    costs_tuple=(
+        cost_params.holding_cost,
+        cost_params.shortage_cost,
+        cost_params.unit_cost,
+        cost_params.ordering_cost,
+    ),
+    seed=seed,
 )
-unit_cost = st.sidebar.number_input(
-    "Purchasing cost per unit", value=DEFAULT_COSTS.unit_cost, step=1.0
-)
-ordering_cost = st.sidebar.number_input(
-    "Fixed ordering cost", value=DEFAULT_COSTS.ordering_cost, step=1.0
-)
-
-seed_input = st.sidebar.text_input("Random seed (optional)", value="0")
-try:
-    seed = int(seed_input)
-except ValueError:
-    seed = None
-
-cost_params = CostParameters(
-    holding_cost=holding_cost,
-    shortage_cost=shortage_cost,
-    unit_cost=unit_cost,
-    ordering_cost=ordering_cost,
-)
-
-# ---- Run simulations ----
-summary_rows = []
-
-for name, (M, N) in PRESET_POLICIES.items():
-    df, total_cost, avg_cost = simulate_policy(
-        M=M,
-        N=N,
-        num_cycles=num_cycles,
-        costs=cost_params,
-        initial_state=DEFAULT_INITIAL_STATE,
-        distributions=DEFAULT_DISTRIBUTIONS,
-        seed=seed,
-    )
-
-    summary_rows.append(
-        {
-            "Policy": name,
-            "M": M,
-            "N": N,
-            "Total Cost": round(total_cost, 2),
-            "Avg. Cost per Cycle": round(avg_cost, 2),
-        }
-    )
-
-summary_df = pd.DataFrame(summary_rows)
 
 st.subheader("Summary Table")
 st.dataframe(summary_df, use_container_width=True)
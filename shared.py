@@ -0,0 +1,104 @@
+"""Helpers shared by the Streamlit pages."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import pandas as pd
+import streamlit as st
+
+from config import (
+    PRESET_POLICIES,
+    DEFAULT_INITIAL_STATE,
+    DEFAULT_DISTRIBUTIONS,
+)
+from simulation import (
+    sample_streams,
+    simulate_policy,
+    simulate_policies_costs,
+    CostParameters,
+)
+
+
+def _preset_streams(num_cycles: int, seed: Optional[int]):
+    """Shared random streams covering the longest preset horizon."""
+    max_days = max(N for _, N in PRESET_POLICIES.values()) * num_cycles
+    return sample_streams(max_days, num_cycles, DEFAULT_DISTRIBUTIONS, seed)
+
+
+@st.cache_data(show_spinner=False)
+def run_all_presets(
+    num_cycles: int,
+    costs_tuple: tuple[float, float, float, float],
+    seed: Optional[int],
+) -> pd.DataFrame:
+    """
+    Simulate every preset (M, N) policy once and return the cost summary table.
+
+    Costs are passed as a plain `(holding, shortage, unit, ordering)` tuple so
+    the cache key is trivially hashable; both the preset page and the summary
+    page call this with the same arguments and share a single cached result.
+    All presets run against the same sampled streams (common random numbers),
+    and only the scalar costs are computed — daily tables are built on demand
+    by `preset_daily_df`.
+    """
+    costs = CostParameters(*costs_tuple)
+
+    names = list(PRESET_POLICIES.keys())
+    Ms = [PRESET_POLICIES[name][0] for name in names]
+    Ns = [PRESET_POLICIES[name][1] for name in names]
+
+    # One batched, parallel, costs-only sweep over all presets
+    results = simulate_policies_costs(
+        Ms=Ms,
+        Ns=Ns,
+        num_cycles=num_cycles,
+        costs=costs,
+        initial_state=DEFAULT_INITIAL_STATE,
+        distributions=DEFAULT_DISTRIBUTIONS,
+        seed=seed,
+    )
+
+    summary_rows = []
+    for name, M, N, (total_cost, avg_cost) in zip(names, Ms, Ns, results):
+        summary_rows.append(
+            {
+                "Policy": name,
+                "M": M,
+                "N": N,
+                "Total Cost": round(total_cost, 2),
+                "Avg. Cost per Cycle": round(avg_cost, 2),
+            }
+        )
+
+    return pd.DataFrame(summary_rows)
+
+
+@st.cache_data(show_spinner=False)
+def preset_daily_df(
+    policy_name: str,
+    num_cycles: int,
+    costs_tuple: tuple[float, float, float, float],
+    seed: Optional[int],
+) -> pd.DataFrame:
+    """
+    Build the daily-results DataFrame for one preset policy, on demand.
+
+    Uses the same shared streams as `run_all_presets`, so the daily table is
+    consistent with the summary costs for the same parameters.
+    """
+    costs = CostParameters(*costs_tuple)
+    M, N = PRESET_POLICIES[policy_name]
+    demands, lead_samples = _preset_streams(num_cycles, seed)
+
+    df, _, _ = simulate_policy(
+        M=M,
+        N=N,
+        num_cycles=num_cycles,
+        costs=costs,
+        initial_state=DEFAULT_INITIAL_STATE,
+        distributions=DEFAULT_DISTRIBUTIONS,
+        precomputed_demands=demands,
+        precomputed_leads=lead_samples,
+    )
+    return df
@@ -0,0 +1,71 @@
+"""Sidebar controls shared by the Streamlit pages."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import streamlit as st
+
+from config import DEFAULT_COSTS, DEFAULT_NUM_CYCLES
+from simulation import CostParameters
+
+
+def cost_sidebar(header: str) -> tuple[CostParameters, int, Optional[int]]:
+    """
+    Render the shared sidebar controls and return `(costs, num_cycles, seed)`.
+
+    Each widget is bound to a stable `key=` so its value lives in
+    `st.session_state` and persists when navigating between pages, instead of
+    every page redefining (and resetting) its own copy of the controls.
+    """
+    st.sidebar.header(header)
+
+    num_cycles = st.sidebar.slider(
+        "Number of cycles",
+        min_value=5,
+        max_value=30,
+        value=DEFAULT_NUM_CYCLES,
+        step=1,
+        key="num_cycles",
+    )
+
+    holding_cost = st.sidebar.number_input(
+        "Holding cost per unit per period",
+        value=DEFAULT_COSTS.holding_cost,
+        step=1.0,
+        key="holding_cost",
+    )
+    shortage_cost = st.sidebar.number_input(
+        "Shortage cost per unit per period",
+        value=DEFAULT_COSTS.shortage_cost,
+        step=1.0,
+        key="shortage_cost",
+    )
+    unit_cost = st.sidebar.number_input(
+        "Purchasing cost per unit",
+        value=DEFAULT_COSTS.unit_cost,
+        step=1.0,
+        key="unit_cost",
+    )
+    ordering_cost = st.sidebar.number_input(
+        "Fixed ordering cost",
+        value=DEFAULT_COSTS.ordering_cost,
+        step=1.0,
+        key="ordering_cost",
+    )
+
+    seed_input = st.sidebar.text_input(
+        "Random seed (optional)", value="0", key="seed_input"
+    )
+    try:
+        seed = int(seed_input)
+    except ValueError:
+        seed = None
+
+    costs = CostParameters(
+        holding_cost=holding_cost,
+        shortage_cost=shortage_cost,
+        unit_cost=unit_cost,
+        ordering_cost=ordering_cost,
+    )
+    return costs, num_cycles, seed
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
 
+import numba
 import numpy as np
 import pandas as pd
+import streamlit as st
 
 
-@dataclass(frozen=True)
-class CostParameters:
+class CostParameters(NamedTuple):
     """Cost structure for the inventory system."""
     holding_cost: float       # cost per unit of ending inventory per period
     shortage_cost: float      # cost per unit of unsatisfied demand per period
@@ -16,32 +17,273 @@ class CostParameters:
     ordering_cost: float      # fixed cost incurred whenever an order is placed
 
 
-@dataclass(frozen=True)
-class InitialState:
+class InitialState(NamedTuple):
     """Initial inventory and outstanding order state."""
     on_hand: int              # units available on hand at the start
     outstanding_qty: int      # units already ordered but not yet received
     lead_remaining: int       # days remaining for the outstanding order to arrive
 
 
-@dataclass(frozen=True)
-class DiscreteDistributions:
+class DiscreteDistributions(NamedTuple):
     """Discrete probability distributions for demand and lead time."""
     demand_values: np.ndarray   # possible demand values
     demand_probs: np.ndarray    # probabilities for each demand value
     lead_values: np.ndarray     # possible lead-time values (in days)
     lead_probs: np.ndarray      # probabilities for each lead-time value
+    demand_cdf: np.ndarray      # cumulative demand probabilities
+    lead_cdf: np.ndarray        # cumulative lead-time probabilities
+    demand_lut: Optional[np.ndarray] = None  # 100-entry percent-bucket lookup table
+    lead_lut: Optional[np.ndarray] = None    # 100-entry percent-bucket lookup table
+
+    @classmethod
+    def from_probs(
+        cls,
+        demand_values: np.ndarray,
+        demand_probs: np.ndarray,
+        lead_values: np.ndarray,
+        lead_probs: np.ndarray,
+    ) -> "DiscreteDistributions":
+        """Build distributions with the CDFs precomputed once for inverse-CDF sampling.
+
+        When the probabilities are exact multiples of 0.01 (as the assignment's
+        are), a 100-entry lookup table is also built so sampling reduces to one
+        `rng.integers` draw plus a gather. The derived arrays are marked
+        read-only, like the module constants in `config.py`.
+        """
+        demand_cdf = np.cumsum(demand_probs)
+        lead_cdf = np.cumsum(lead_probs)
+        demand_lut = _build_percent_lut(demand_values, demand_probs)
+        lead_lut = _build_percent_lut(lead_values, lead_probs)
+        for arr in (demand_cdf, lead_cdf, demand_lut, lead_lut):
+            if arr is not None:
+                arr.setflags(write=False)
+        return cls(
+            demand_values=demand_values,
+            demand_probs=demand_probs,
+            lead_values=lead_values,
+            lead_probs=lead_probs,
+            demand_cdf=demand_cdf,
+            lead_cdf=lead_cdf,
+            demand_lut=demand_lut,
+            lead_lut=lead_lut,
+        )
+
+
+def _build_percent_lut(values: np.ndarray, probs: np.ndarray) -> Optional[np.ndarray]:
+    """Expand a distribution into a 100-entry lookup table of percent buckets.
+
+    Returns None when the probabilities are not exact multiples of 0.01, in
+    which case sampling falls back to the inverse-CDF path.
+    """
+    percents = np.rint(probs * 100).astype(np.int64)
+    if percents.sum() != 100 or not np.allclose(percents / 100.0, probs):
+        return None
+    return np.repeat(values, percents)
+
+
+# Per-day output record: one contiguous typed buffer instead of separate
+# Python-object rows, allocated once per simulation run.
+_RECORD_DTYPE = np.dtype(
+    [
+        ("on_hand_start", np.int64),
+        ("incoming", np.int64),
+        ("sales", np.int64),
+        ("ending", np.int64),
+        ("shortage", np.int64),
+        ("holding_cost", np.float64),
+        ("shortage_cost", np.float64),
+        ("order_qty", np.int64),
+        ("lead_assigned", np.int64),
+        ("lead_remaining", np.int64),
+        ("purchasing_cost", np.float64),
+        ("ordering_cost", np.float64),
+        ("day_cost", np.float64),
+    ]
+)
 
 
 def _sample_from_discrete(
     values: np.ndarray,
-    probs: np.ndarray,
+    cdf: np.ndarray,
     rng: np.random.Generator,
-) -> int:
-    """Sample a value from a discrete distribution defined by `values` and `probs`."""
-    return int(rng.choice(values, p=probs))
+    size: int,
+    lut: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Sample `size` values from a discrete distribution.
+
+    Uses the percent-bucket lookup table when one is available (a single
+    integer draw plus a gather), otherwise inverse-CDF lookup on the
+    precomputed `cdf`.
+    """
+    if lut is not None:
+        return lut[rng.integers(0, lut.size, size=size)]
+    return values[np.searchsorted(cdf, rng.random(size))]
+
+
+# The explicit signature makes Numba compile eagerly at import time instead of
+# on the first call, so the first Streamlit interaction pays no JIT cost;
+# cache=True persists the compiled kernel on disk across app restarts, and
+# nogil=True lets independent policies run on a thread pool in parallel.
+@numba.njit(
+    "void(i8, i8, i8, i8, i8, i8, i8[:], i8[:], f8, f8, f8, f8,"
+    " i8[:], i8[:], i8[:], i8[:], i8[:], f8[:], f8[:], i8[:], i8[:], i8[:],"
+    " f8[:], f8[:], f8[:])",
+    cache=True,
+    nogil=True,
+)
+def _simulate_core(
+    M: int,
+    N: int,
+    num_days: int,
+    on_hand: int,
+    outstanding_qty: int,
+    lead_remaining: int,
+    demands: np.ndarray,
+    lead_samples: np.ndarray,
+    holding_cost_rate: float,
+    shortage_cost_rate: float,
+    unit_cost_rate: float,
+    ordering_cost_rate: float,
+    on_hand_start_arr: np.ndarray,
+    incoming_arr: np.ndarray,
+    sales_arr: np.ndarray,
+    ending_arr: np.ndarray,
+    shortage_arr: np.ndarray,
+    holding_cost_arr: np.ndarray,
+    shortage_cost_arr: np.ndarray,
+    order_qty_arr: np.ndarray,
+    lead_assigned_arr: np.ndarray,
+    lead_remaining_arr: np.ndarray,
+    purchasing_cost_arr: np.ndarray,
+    ordering_cost_arr: np.ndarray,
+    day_cost_arr: np.ndarray,
+) -> None:
+    """Run the day-by-day (M, N) state machine, filling preallocated output arrays.
+
+    The loop carries `on_hand`, `outstanding_qty`, and `lead_remaining` across
+    days, so it cannot be expressed as a single NumPy expression; JIT-compiling
+    it removes the Python interpreter overhead instead. The total cost is
+    reduced from the filled columns by the caller.
+    """
+    # Precompute the review-day mask so the loop body has no modulo; days
+    # N, 2N, 3N, ... (0-based indices N-1, 2N-1, ...) are review days.
+    review_mask = np.zeros(num_days, dtype=np.bool_)
+    for i in range(N - 1, num_days, N):
+        review_mask[i] = True
+
+    for day in range(1, num_days + 1):
+        i = day - 1
+
+        # 1) Receive outstanding order at the start of the day, if its lead time has expired
+        incoming_today = 0
+        if lead_remaining == 0 and outstanding_qty > 0:
+            incoming_today = outstanding_qty
+            on_hand += incoming_today
+            outstanding_qty = 0
+
+        on_hand_start = on_hand
+
+        # 2) Read the pre-sampled daily demand
+        demand = demands[i]
+
+        # 3) Compute sales, ending inventory, and shortage quantity; the
+        #    conditional expression lowers to a branchless min, and the
+        #    shortage falls out as the unmet remainder. Decrementing on_hand
+        #    in place is also the state update for the next day.
+        sales = demand if demand < on_hand else on_hand
+        shortage_qty = demand - sales
+        on_hand -= sales
+        ending_inventory = on_hand
+
+        # 4) Compute holding and shortage costs for the day
+        holding_cost = ending_inventory * holding_cost_rate
+        shortage_cost = shortage_qty * shortage_cost_rate
+
+        order_qty = 0
+        purchasing_cost = 0.0
+        ordering_cost = 0.0
+
+        # 5) + 6) At the end of a review day, place an order if needed; the
+        # three conditions are fused into one predicate for a single branch.
+        wants_order = review_mask[i] and ending_inventory < M and outstanding_qty == 0
+        if wants_order:
+            order_qty = M - ending_inventory
 
+            # Use the pre-sampled lead time for this cycle's order
+            lead_time_assigned = lead_samples[i // N]
+            lead_assigned_arr[i] = lead_time_assigned
 
+            outstanding_qty = order_qty
+            lead_remaining = lead_time_assigned
+
+            purchasing_cost = order_qty * unit_cost_rate
+            ordering_cost = ordering_cost_rate
+
+        # 7) Decrease lead time for outstanding orders. An outstanding order
+        #    always has lead_remaining > 0 here (step 1 clears delivered
+        #    orders, step 6 assigns a fresh lead time), so the extra
+        #    lead_remaining check was redundant.
+        if outstanding_qty > 0:
+            lead_remaining -= 1
+
+        # 8) Aggregate total daily cost
+        day_cost = holding_cost + shortage_cost + purchasing_cost + ordering_cost
+
+        on_hand_start_arr[i] = on_hand_start
+        incoming_arr[i] = incoming_today
+        sales_arr[i] = sales
+        ending_arr[i] = ending_inventory
+        shortage_arr[i] = shortage_qty
+        holding_cost_arr[i] = holding_cost
+        shortage_cost_arr[i] = shortage_cost
+        order_qty_arr[i] = order_qty
+        lead_remaining_arr[i] = lead_remaining
+        purchasing_cost_arr[i] = purchasing_cost
+        ordering_cost_arr[i] = ordering_cost
+        day_cost_arr[i] = day_cost
+
+
+# CostParameters and InitialState are NamedTuples of scalars and hash
+# natively; only the array-valued distributions need a custom hasher.
+_HASH_FUNCS = {
+    DiscreteDistributions: lambda d: (
+        d.demand_values.tobytes(),
+        d.demand_probs.tobytes(),
+        d.lead_values.tobytes(),
+        d.lead_probs.tobytes(),
+    ),
+}
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_HASH_FUNCS)
+def sample_streams(
+    num_days: int,
+    num_cycles: int,
+    distributions: DiscreteDistributions,
+    seed: Optional[int] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sample the shared demand and lead-time streams for a simulation horizon.
+
+    Returns `(demands, lead_samples)` with `num_days` daily demands and one
+    potential lead time per cycle. The result is cached per
+    `(num_days, num_cycles, distributions, seed)`, so reruns that only change
+    cost parameters reuse the same streams, and simulations driven by the same
+    streams are compared under common random numbers.
+    """
+    rng = np.random.default_rng(seed)
+    demands = _sample_from_discrete(
+        distributions.demand_values, distributions.demand_cdf, rng, num_days,
+        lut=distributions.demand_lut,
+    )
+    lead_samples = _sample_from_discrete(
+        distributions.lead_values, distributions.lead_cdf, rng, num_cycles,
+        lut=distributions.lead_lut,
+    )
+    return demands, lead_samples
+
+
+@st.cache_data(show_spinner=False, max_entries=64, hash_funcs=_HASH_FUNCS)
 def simulate_policy(
     M: int,
     N: int,
@@ -50,6 +292,8 @@ def simulate_policy(
     initial_state: InitialState,
     distributions: DiscreteDistributions,
     seed: Optional[int] = None,
+    precomputed_demands: Optional[np.ndarray] = None,
+    precomputed_leads: Optional[np.ndarray] = None,
 ) -> tuple[pd.DataFrame, float, float]:
     """
     Simulate the (M, N) inventory policy.
@@ -69,7 +313,13 @@ def simulate_policy(
     distributions : DiscreteDistributions
         Discrete distributions for daily demand and lead time.
     seed : Optional[int]
-        Random seed for reproducibility.
+        Random seed for reproducibility. Ignored when precomputed streams
+        are supplied.
+    precomputed_demands : Optional[np.ndarray]
+        Pre-sampled daily demands (at least `N * num_cycles` long), e.g. from
+        `sample_streams`, for common-random-number comparisons.
+    precomputed_leads : Optional[np.ndarray]
+        Pre-sampled per-cycle lead times (at least `num_cycles` long).
 
     Returns
     -------
@@ -80,102 +330,232 @@ def simulate_policy(
     avg_cost_per_cycle : float
         Average cost per review cycle (= total_cost / num_cycles).
     """
-    rng = np.random.default_rng(seed)
     num_days = N * num_cycles
 
-    # Copy initial state into mutable local variables
-    on_hand = int(initial_state.on_hand)
-    outstanding_qty = int(initial_state.outstanding_qty)
-    lead_remaining = int(initial_state.lead_remaining)
-
-    records: list[dict] = []
-    total_cost = 0.0
+    if precomputed_demands is not None and precomputed_leads is not None:
+        demands = precomputed_demands[:num_days]
+        lead_samples = precomputed_leads[:num_cycles]
+    else:
+        demands, lead_samples = sample_streams(num_days, num_cycles, distributions, seed)
 
-    for day in range(1, num_days + 1):
-        cycle = (day - 1) // N + 1
+    return _run_policy(M, N, num_cycles, costs, initial_state, demands, lead_samples)
 
-        # 1) Receive outstanding order at the start of the day, if its lead time has expired
-        incoming_today = 0
-        if lead_remaining == 0 and outstanding_qty > 0:
-            incoming_today = outstanding_qty
-            on_hand += incoming_today
-            outstanding_qty = 0
 
-        on_hand_start = on_hand
+@st.cache_data(show_spinner=False, max_entries=256, hash_funcs=_HASH_FUNCS)
+def simulate_policy_costs(
+    M: int,
+    N: int,
+    num_cycles: int,
+    costs: CostParameters,
+    initial_state: InitialState,
+    distributions: DiscreteDistributions,
+    seed: Optional[int] = None,
+    precomputed_demands: Optional[np.ndarray] = None,
+    precomputed_leads: Optional[np.ndarray] = None,
+) -> tuple[float, float]:
+    """
+    Simulate the (M, N) policy and return only `(total_cost, avg_cost_per_cycle)`.
 
-        # 2) Sample daily demand from the distribution
-        demand = _sample_from_discrete(
-            distributions.demand_values,
-            distributions.demand_probs,
-            rng,
-        )
+    Same model as `simulate_policy`, but skips the daily DataFrame build, so
+    it is the cheap entry point (and cache entry) for summary tables, charts,
+    and parameter sweeps that never inspect the per-day results.
+    """
+    num_days = N * num_cycles
 
-        # 3) Compute sales, ending inventory, and shortage quantity
-        sales = min(on_hand, demand)
-        shortage_qty = max(demand - on_hand, 0)
-        ending_inventory = on_hand - sales
+    if precomputed_demands is not None and precomputed_leads is not None:
+        demands = precomputed_demands[:num_days]
+        lead_samples = precomputed_leads[:num_cycles]
+    else:
+        demands, lead_samples = sample_streams(num_days, num_cycles, distributions, seed)
 
-        # 4) Compute holding and shortage costs for the day
-        holding_cost = ending_inventory * costs.holding_cost
-        shortage_cost = shortage_qty * costs.shortage_cost
+    _, total_cost = _run_policy_buf(
+        M, N, num_cycles, costs, initial_state, demands, lead_samples
+    )
+    return total_cost, total_cost / num_cycles
 
-        # 5) Check if today is a review day
-        is_review_day = (day % N == 0)
 
-        order_qty = 0
-        purchasing_cost = 0.0
-        ordering_cost = 0.0
-        lead_time_assigned: Optional[int] = None
+def simulate_policies(
+    Ms: "list[int] | np.ndarray",
+    Ns: "list[int] | np.ndarray",
+    num_cycles: int,
+    costs: CostParameters,
+    initial_state: InitialState,
+    distributions: DiscreteDistributions,
+    seed: Optional[int] = None,
+) -> list[tuple[pd.DataFrame, float, float]]:
+    """
+    Simulate several (M, N) policies against a single shared random stream.
 
-        # 6) At the end of a review day, place an order if needed
-        if is_review_day and ending_inventory < M and outstanding_qty == 0:
-            order_qty = M - ending_inventory
+    Demands are sampled once for the longest horizon (`max(Ns) * num_cycles`)
+    and lead times once per cycle; every policy consumes a prefix of the same
+    streams. This does the sampling work once instead of once per policy and
+    doubles as common random numbers, so policy comparisons are not confounded
+    by sampling noise.
 
-            # Sample lead time for the new order
-            lead_time_assigned = _sample_from_discrete(
-                distributions.lead_values,
-                distributions.lead_probs,
-                rng,
-            )
+    Returns
+    -------
+    list of (df, total_cost, avg_cost_per_cycle)
+        One result tuple per (M, N) pair, in input order, with the same
+        contents as `simulate_policy`.
+    """
+    max_days = int(max(Ns)) * num_cycles
+    demands, lead_samples = sample_streams(max_days, num_cycles, distributions, seed)
+
+    def run(policy: tuple[int, int]) -> tuple[pd.DataFrame, float, float]:
+        M, N = policy
+        return _run_policy(
+            M, N, num_cycles, costs, initial_state,
+            demands[: int(N) * num_cycles], lead_samples,
+        )
 
-            outstanding_qty = order_qty
-            lead_remaining = lead_time_assigned
+    # The policies are independent and the jitted kernel releases the GIL,
+    # so a small thread pool runs them in parallel.
+    with ThreadPoolExecutor(max_workers=min(4, len(Ms))) as pool:
+        return list(pool.map(run, zip(Ms, Ns)))
 
-            purchasing_cost = order_qty * costs.unit_cost
-            ordering_cost = costs.ordering_cost
 
-        # 7) Decrease lead time for outstanding orders
-        if outstanding_qty > 0 and lead_remaining > 0:
-            lead_remaining -= 1
+def simulate_policies_costs(
+    Ms: "list[int] | np.ndarray",
+    Ns: "list[int] | np.ndarray",
+    num_cycles: int,
+    costs: CostParameters,
+    initial_state: InitialState,
+    distributions: DiscreteDistributions,
+    seed: Optional[int] = None,
+) -> list[tuple[float, float]]:
+    """
+    Costs-only variant of `simulate_policies`: shared streams, parallel sweep,
+    no daily DataFrames. Returns one `(total_cost, avg_cost_per_cycle)` pair
+    per (M, N) policy, in input order.
+    """
+    max_days = int(max(Ns)) * num_cycles
+    demands, lead_samples = sample_streams(max_days, num_cycles, distributions, seed)
+
+    def run(policy: tuple[int, int]) -> tuple[float, float]:
+        M, N = policy
+        _, total_cost = _run_policy_buf(
+            M, N, num_cycles, costs, initial_state,
+            demands[: int(N) * num_cycles], lead_samples,
+        )
+        return total_cost, total_cost / num_cycles
 
-        # 8) Prepare on-hand inventory for the next day
-        on_hand = ending_inventory
+    with ThreadPoolExecutor(max_workers=min(4, len(Ms))) as pool:
+        return list(pool.map(run, zip(Ms, Ns)))
 
-        # 9) Aggregate total daily cost
-        day_cost = holding_cost + shortage_cost + purchasing_cost + ordering_cost
-        total_cost += day_cost
-
-        records.append(
-            {
-                "Day": day,
-                "Cycle": cycle,
-                "On-hand start": on_hand_start,
-                "Incoming today": incoming_today,
-                "Demand": demand,
-                "Sales": sales,
-                "Ending inventory": ending_inventory,
-                "Shortage qty": shortage_qty,
-                "Holding cost": holding_cost,
-                "Shortage cost": shortage_cost,
-                "Order qty": order_qty,
-                "Lead time (new order)": lead_time_assigned,
-                "Lead remaining end": lead_remaining,
-                "Purchasing cost": purchasing_cost,
-                "Ordering cost": ordering_cost,
-                "Total cost (day)": day_cost,
-            }
-        )
 
-    df = pd.DataFrame(records)
+def _run_policy(
+    M: int,
+    N: int,
+    num_cycles: int,
+    costs: CostParameters,
+    initial_state: InitialState,
+    demands: np.ndarray,
+    lead_samples: np.ndarray,
+) -> tuple[pd.DataFrame, float, float]:
+    """Run one (M, N) policy against pre-sampled streams, with daily DataFrame."""
+    buf, total_cost = _run_policy_buf(
+        M, N, num_cycles, costs, initial_state, demands, lead_samples
+    )
+    df = _build_daily_df(buf, demands, N)
     avg_cost_per_cycle = total_cost / num_cycles
     return df, total_cost, avg_cost_per_cycle
+
+
+def _run_policy_buf(
+    M: int,
+    N: int,
+    num_cycles: int,
+    costs: CostParameters,
+    initial_state: InitialState,
+    demands: np.ndarray,
+    lead_samples: np.ndarray,
+) -> tuple[np.ndarray, float]:
+    """Run one (M, N) policy and return the raw record buffer and total cost."""
+    num_days = N * num_cycles
+
+    # Copy initial state into mutable local variables
+    on_hand = int(initial_state.on_hand)
+    outstanding_qty = int(initial_state.outstanding_qty)
+    lead_remaining = int(initial_state.lead_remaining)
+
+    # Preallocate the whole output as one structured (SoA) buffer; the jitted
+    # core fills the field views in place and the DataFrame is built from them.
+    buf = np.zeros(num_days, dtype=_RECORD_DTYPE)
+    # -1 marks days without a new order; converted to a nullable Int64 column below
+    buf["lead_assigned"] = -1
+
+    _simulate_core(
+        int(M),
+        int(N),
+        num_days,
+        on_hand,
+        outstanding_qty,
+        lead_remaining,
+        demands.astype(np.int64),
+        lead_samples.astype(np.int64),
+        float(costs.holding_cost),
+        float(costs.shortage_cost),
+        float(costs.unit_cost),
+        float(costs.ordering_cost),
+        buf["on_hand_start"],
+        buf["incoming"],
+        buf["sales"],
+        buf["ending"],
+        buf["shortage"],
+        buf["holding_cost"],
+        buf["shortage_cost"],
+        buf["order_qty"],
+        buf["lead_assigned"],
+        buf["lead_remaining"],
+        buf["purchasing_cost"],
+        buf["ordering_cost"],
+        buf["day_cost"],
+    )
+
+    # One fused dot product over the component totals replaces the per-day
+    # scalar accumulation of day_cost; an order is placed iff order_qty > 0.
+    component_totals = np.array(
+        [
+            buf["ending"].sum(),
+            buf["shortage"].sum(),
+            buf["order_qty"].sum(),
+            np.count_nonzero(buf["order_qty"]),
+        ],
+        dtype=np.float64,
+    )
+    cost_rates = np.array(
+        [costs.holding_cost, costs.shortage_cost, costs.unit_cost, costs.ordering_cost],
+        dtype=np.float64,
+    )
+    total_cost = float(np.vdot(component_totals, cost_rates))
+
+    return buf, total_cost
+
+
+def _build_daily_df(buf: np.ndarray, demands: np.ndarray, N: int) -> pd.DataFrame:
+    """Package a filled record buffer as the daily-results DataFrame."""
+    num_days = len(buf)
+    days = np.arange(1, num_days + 1)
+    lead_assigned = pd.array(buf["lead_assigned"], dtype="Int64")
+    lead_assigned[buf["lead_assigned"] < 0] = pd.NA
+    df = pd.DataFrame(
+        {
+            "Day": days,
+            "Cycle": (days - 1) // N + 1,
+            "On-hand start": buf["on_hand_start"],
+            "Incoming today": buf["incoming"],
+            "Demand": demands,
+            "Sales": buf["sales"],
+            "Ending inventory": buf["ending"],
+            "Shortage qty": buf["shortage"],
+            "Holding cost": buf["holding_cost"],
+            "Shortage cost": buf["shortage_cost"],
+            "Order qty": buf["order_qty"],
+            "Lead time (new order)": lead_assigned,
+            "Lead remaining end": buf["lead_remaining"],
+            "Purchasing cost": buf["purchasing_cost"],
+            "Ordering cost": buf["ordering_cost"],
+            "Total cost (day)": buf["day_cost"],
+        }
+    )
+    return df